@@ -254,9 +254,11 @@ class Evaluator:
         for k, v in job.metadata.items():
             self._storage.store_job_metadata(job.id, k, v)
 
+    def _on_done_batch(self, jobs):
+        """Called after a batch of jobs has completed and each job was processed by ``_on_done``."""
         # call callbacks
         for cb in self._callbacks:
-            cb.on_done(job)
+            cb.on_done_batch(jobs)
 
     async def _execute(self, job):
         job = await self.execute(job)
@@ -328,6 +330,8 @@ class Evaluator:
             self._tasks_running.remove(task)
             self.job_id_gathered.append(job.id)
 
+        self._on_done_batch(local_results)
+
         self._tasks_done = []
         self._tasks_pending = []
 
@@ -3,10 +3,44 @@ from collections.abc import MutableMapping
 
 from typing import Hashable
 
+import numpy as np
+
 from deephyper.evaluator.storage import Storage, MemoryStorage
 from deephyper.evaluator._run_function_utils import standardize_run_function_output
 from deephyper.stopper._stopper import Stopper
 
+# immutable scalar types which can be shared between copies of a configuration
+_PRIMITIVE_TYPES = (int, float, str, bool, type(None), np.number, np.bool_)
+
+
+def _is_primitive_sequence(value) -> bool:
+    return type(value) in (list, tuple) and all(
+        isinstance(v, _PRIMITIVE_TYPES) for v in value
+    )
+
+
+def _fast_copy(config: dict) -> dict:
+    """Copy a configuration. Hyperparameter configurations usually map names to primitive values or to lists/tuples of primitive values, for which a specialized copy is done: primitive values and tuples are shared and lists are shallow copied. Other configurations fall back to ``copy.deepcopy``.
+
+    Args:
+        config (dict): the configuration to copy.
+
+    Returns:
+        dict: the copied configuration.
+    """
+    if type(config) is not dict:
+        return copy.deepcopy(config)
+
+    copied = {}
+    for k, v in config.items():
+        if isinstance(v, _PRIMITIVE_TYPES):
+            copied[k] = v
+        elif _is_primitive_sequence(v):
+            copied[k] = list(v) if type(v) is list else v
+        else:
+            return copy.deepcopy(config)
+    return copied
+
 
 class Job:
     """Represents an evaluation executed by the ``Evaluator`` class.
@@ -17,6 +51,17 @@ class Job:
         run_function (callable): function executed by the ``Evaluator``
     """
 
+    __slots__ = (
+        "id",
+        "rank",
+        "config",
+        "run_function",
+        "status",
+        "output",
+        "observations",
+        "dequed",
+    )
+
     # Job status states.
     READY = 0
     RUNNING = 1
@@ -25,7 +70,7 @@ class Job:
     def __init__(self, id, config: dict, run_function):
         self.id = id
         self.rank = None
-        self.config = copy.deepcopy(config)
+        self.config = _fast_copy(config)
         self.run_function = run_function
         self.status = self.READY
         self.output = {
@@ -41,8 +86,11 @@ class Job:
             return f"Job(id={self.id}, status={self.status}, config={self.config})"
 
     def __getitem__(self, index):
-        cfg = copy.deepcopy(self.config)
-        return (cfg, self.objective)[index]
+        return (self.config, self.objective)[index]
+
+    def config_copy(self) -> dict:
+        """Returns a copy of the configuration of the job which can be modified without side effects on the job."""
+        return _fast_copy(self.config)
 
     @property
     def result(self):
@@ -83,6 +131,8 @@ class RunningJob(MutableMapping):
         stopper (Stopper, optional): The stopper object used for the evaluation. Defaults to None.
     """
 
+    __slots__ = ("id", "parameters", "storage", "stopper", "obs")
+
     def __init__(
         self,
         id: Hashable = None,
@@ -104,10 +154,20 @@ class RunningJob(MutableMapping):
         self.obs = None
 
     def __getitem__(self, key):
+        # hyperparameters are looked up first as they are the most frequently accessed
+        # keys, "job_id" is reserved even if present in the parameters
+        try:
+            value = self.parameters[key]
+        except KeyError:
+            if key == "job_id":
+                return int(self.id.split(".")[-1])
+            raise
         if key == "job_id":
             return int(self.id.split(".")[-1])
+        return value
 
-        return self.parameters[key]
+    def __contains__(self, key):
+        return key == "job_id" or key in self.parameters
 
     def __setitem__(self, key, value):
         if key == "job_id":
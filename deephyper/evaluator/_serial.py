@@ -21,6 +21,10 @@ class SerialEvaluator(Evaluator):
         search_id (Hashable, optional): The id of the search to use in the corresponding storage. If ``None`` it will create a new search identifier when initializing the search.
     """
 
+    # The configuration of a job is already copied when the ``Job`` is created.
+    # Set to ``True`` to give the ``run_function`` its own copy of it.
+    _defensive_copy = False
+
     def __init__(
         self,
         run_function: Callable,
@@ -51,6 +55,8 @@ class SerialEvaluator(Evaluator):
     async def execute(self, job: Job) -> Job:
 
         running_job = job.create_running_job(self._storage, self._stopper)
+        if self._defensive_copy:
+            running_job.parameters = job.config_copy()
 
         output = self.run_function(running_job, **self.run_function_kwargs)
 
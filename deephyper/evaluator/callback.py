@@ -1,5 +1,8 @@
 """The callback module contains sub-classes of the ``Callback`` class used to trigger custom actions on the start and completion of jobs by the ``Evaluator``. Callbacks can be used with any Evaluator implementation.
 """
+import math
+import sys
+
 import deephyper.core.exceptions
 import numpy as np
 import pandas as pd
@@ -10,6 +13,15 @@ if _test_ipython_interpretor():
 else:
     from tqdm import tqdm
 
+_REAL_TYPES = (int, float, np.integer, np.floating)
+
+
+def _is_real(value) -> bool:
+    """Test if a value is a real number which is not NaN without going through NumPy."""
+    return isinstance(value, _REAL_TYPES) and not (
+        isinstance(value, (float, np.floating)) and math.isnan(value)
+    )
+
 
 class Callback:
     def on_launch(self, job):
@@ -26,6 +38,15 @@ class Callback:
             job (Job): The completed job.
         """
 
+    def on_done_batch(self, jobs):
+        """Called each time a batch of Jobs is completed by the Evaluator. By default ``on_done`` is called for each job of the batch.
+
+        Args:
+            jobs (List[Job]): The completed jobs.
+        """
+        for job in jobs:
+            self.on_done(job)
+
     def on_done_other(self, job):
         """Called each time a Job is collected from an other process.
 
@@ -43,33 +64,81 @@ class ProfilingCallback(Callback):
     >>> evaluator.create(method="ray", method_kwargs={..., "callbacks": [profiler]})
     ...
     >>> profiler.profile
+
+    Args:
+        capacity (int, optional): The number of jobs for which memory is preallocated, the buffers are doubled when full. Defaults to 1024.
     """
 
-    def __init__(self):
-        self.history = []
+    def __init__(self, capacity: int = 1024):
+        # start and end timestamps of completed jobs
+        self._starts = np.empty(capacity, dtype=np.float64)
+        self._ends = np.empty(capacity, dtype=np.float64)
+        self._n = 0
+        self._profile = None  # cached profile, reset when new jobs are recorded
+
+    def _reserve(self, n: int):
+        """Make sure ``n`` more jobs can be recorded, doubling the buffers if needed."""
+        capacity = len(self._starts)
+        if self._n + n <= capacity:
+            return
+        while self._n + n > capacity:
+            capacity = max(2 * capacity, 1)
+        starts = np.empty(capacity, dtype=np.float64)
+        ends = np.empty(capacity, dtype=np.float64)
+        starts[: self._n] = self._starts[: self._n]
+        ends[: self._n] = self._ends[: self._n]
+        self._starts, self._ends = starts, ends
 
     def on_launch(self, job):
         ...
 
+    @staticmethod
+    def _timestamps(job):
+        start = job.metadata["timestamp_submit"]
+        end = job.metadata["timestamp_gather"]
+        if (
+            job.metadata.get("timestamp_start") is not None
+            and job.metadata.get("timestamp_end") is not None
+        ):
+            start = job.metadata["timestamp_start"]
+            end = job.metadata["timestamp_end"]
+        return start, end
+
     def on_done(self, job):
-        start = job.timestamp_submit
-        end = job.timestamp_gather
-        if job.timestamp_start is not None and job.timestamp_end is not None:
-            start = job.timestamp_start
-            end = job.timestamp_end
-        self.history.append((start, 1))
-        self.history.append((end, -1))
+        self._reserve(1)
+        self._starts[self._n], self._ends[self._n] = self._timestamps(job)
+        self._n += 1
+        self._profile = None
+
+    def on_done_batch(self, jobs):
+        m = len(jobs)
+        self._reserve(m)
+        timestamps = np.fromiter(
+            (t for job in jobs for t in self._timestamps(job)),
+            dtype=np.float64,
+            count=2 * m,
+        )
+        self._starts[self._n : self._n + m] = timestamps[0::2]
+        self._ends[self._n : self._n + m] = timestamps[1::2]
+        self._n += m
+        self._profile = None
 
     @property
     def profile(self):
-        n_jobs = 0
-        profile = []
-        for t, incr in sorted(self.history):
-            n_jobs += incr
-            profile.append([t, n_jobs])
-        cols = ["timestamp", "n_jobs_running"]
-        df = pd.DataFrame(profile, columns=cols)
-        return df
+        if self._profile is not None:
+            return self._profile.copy()
+
+        # ends are placed before starts so that the stable sort orders ends first on
+        # equal timestamps
+        t = np.concatenate([self._ends[: self._n], self._starts[: self._n]])
+        order = np.argsort(t, kind="stable")
+        timestamp = t[order]
+        n_jobs_running = np.cumsum(np.where(order < self._n, -1, 1))
+
+        self._profile = pd.DataFrame(
+            {"timestamp": timestamp, "n_jobs_running": n_jobs_running}
+        )
+        return self._profile.copy()
 
 
 class LoggerCallback(Callback):
@@ -78,43 +147,47 @@ class LoggerCallback(Callback):
     An example usage can be:
 
     >>> evaluator.create(method="ray", method_kwargs={..., "callbacks": [LoggerCallback()]})
+
+    The lines of a batch of completed jobs are written to the standard output at once.
     """
 
     def __init__(self):
         self._best_objective = None
         self._n_done = 0
 
-    def on_done_other(self, job):
-        self.on_done(job)
-
-    def on_done(self, job):
+    def _format(self, job):
+        """Update the best objective with a completed job and returns the line to log (or ``None``)."""
         self._n_done += 1
         # Test if multi objectives are received
         if np.ndim(job.objective) > 0:
-            if np.isreal(job.objective).all():
-                if self._best_objective is None:
-                    self._best_objective = np.sum(job.objective)
-                else:
-                    self._best_objective = max(
-                        np.sum(job.objective), self._best_objective
-                    )
-
-                print(
-                    f"[{self._n_done:05d}] -- best sum(objective): {self._best_objective:.5f} -- received sum(objective): {np.sum(job.objective):.5f}"
-                )
-            elif np.any(type(res) is str and "F" == res[0] for res in job.objective):
-                print(f"[{self._n_done:05d}] -- received failure: {job.objective}")
-        elif np.isreal(job.objective):
-            if self._best_objective is None:
+            if all(_is_real(objective_i) for objective_i in job.objective):
+                objective = np.sum(job.objective)
+                if self._best_objective is None or objective > self._best_objective:
+                    self._best_objective = objective
+
+                return f"[{self._n_done:05d}] -- best sum(objective): {self._best_objective:.5f} -- received sum(objective): {objective:.5f}\n"
+            elif any(type(res) is str and "F" == res[0] for res in job.objective):
+                return f"[{self._n_done:05d}] -- received failure: {job.objective}\n"
+        elif _is_real(job.objective):
+            if self._best_objective is None or job.objective > self._best_objective:
                 self._best_objective = job.objective
-            else:
-                self._best_objective = max(job.objective, self._best_objective)
 
-            print(
-                f"[{self._n_done:05d}] -- best objective: {self._best_objective:.5f} -- received objective: {job.objective:.5f}"
-            )
+            return f"[{self._n_done:05d}] -- best objective: {self._best_objective:.5f} -- received objective: {job.objective:.5f}\n"
         elif type(job.objective) is str and "F" == job.objective[0]:
-            print(f"[{self._n_done:05d}] -- received failure: {job.objective}")
+            return f"[{self._n_done:05d}] -- received failure: {job.objective}\n"
+
+    def on_done_other(self, job):
+        self.on_done(job)
+
+    def on_done(self, job):
+        line = self._format(job)
+        if line is not None:
+            sys.stdout.write(line)
+
+    def on_done_batch(self, jobs):
+        lines = [line for line in map(self._format, jobs) if line is not None]
+        if lines:
+            sys.stdout.write("".join(lines))
 
 
 class TqdmCallback(Callback):
@@ -130,6 +203,7 @@ class TqdmCallback(Callback):
         self._n_done = 0
         self._n_failures = 0
         self._max_evals = None
+        self._multi_objective = False
         self._tqdm = None
 
     def set_max_evals(self, max_evals):
@@ -139,52 +213,81 @@ class TqdmCallback(Callback):
     def on_done_other(self, job):
         self.on_done(job)
 
-    def on_done(self, job):
-        if self._tqdm is None:
-            if self._max_evals:
-                self._tqdm = tqdm(total=self._max_evals)
-            else:
-                self._tqdm = tqdm()
+    def _create_tqdm(self):
+        if self._max_evals:
+            self._tqdm = tqdm(total=self._max_evals)
+        else:
+            self._tqdm = tqdm()
 
-        self._n_done += 1
-        self._tqdm.update(1)
+    def _observe(self, job) -> bool:
+        """Update the best objective and number of failures with a completed job. Returns ``True`` if one of them changed."""
         # Test if multi objectives are received
         if np.ndim(job.objective) > 0:
-            if not (any(not (np.isreal(objective_i)) for objective_i in job.objective)):
-                if self._best_objective is None:
-                    self._best_objective = np.sum(job.objective)
-                else:
-                    self._best_objective = max(
-                        np.sum(job.objective), self._best_objective
-                    )
-            else:
-                self._n_failures += 1
+            self._multi_objective = True
+            if all(_is_real(objective_i) for objective_i in job.objective):
+                objective = np.sum(job.objective)
+                if self._best_objective is None or objective > self._best_objective:
+                    self._best_objective = objective
+                    return True
+                return False
+        else:
+            self._multi_objective = False
+            if _is_real(job.objective):
+                if self._best_objective is None or job.objective > self._best_objective:
+                    self._best_objective = job.objective
+                    return True
+                return False
+        self._n_failures += 1
+        return True
+
+    def _set_postfix(self):
+        if self._multi_objective:
             self._tqdm.set_postfix(
                 {"failures": self._n_failures, "sum(objective)": self._best_objective}
             )
         else:
-            if np.isreal(job.objective):
-                if self._best_objective is None:
-                    self._best_objective = job.objective
-                else:
-                    self._best_objective = max(job.objective, self._best_objective)
-            else:
-                self._n_failures += 1
             self._tqdm.set_postfix(
                 objective=self._best_objective, failures=self._n_failures
             )
 
+    def on_done(self, job):
+        if self._tqdm is None:
+            self._create_tqdm()
+
+        self._n_done += 1
+        self._tqdm.update(1)
+
+        # the postfix is only refreshed when it changes because it redraws the bar
+        if self._observe(job):
+            self._set_postfix()
+
+    def on_done_batch(self, jobs):
+        if len(jobs) == 0:
+            return
+
+        if self._tqdm is None:
+            self._create_tqdm()
+
+        self._n_done += len(jobs)
+        self._tqdm.update(len(jobs))
+
+        updated = False
+        for job in jobs:
+            updated = self._observe(job) or updated
+        if updated:
+            self._set_postfix()
+
 
 class SearchEarlyStopping(Callback):
     """Stop the search gracefully when it does not improve for a given number of evaluations.
 
     Args:
         patience (int, optional): The number of not improving evaluations to wait for before stopping the search. Defaults to 10.
-        objective_func (callable, optional): A function that takes a ``Job`` has input and returns the maximized scalar value monitored by this callback. Defaults to ``lambda j: j.result``.
+        objective_func (callable, optional): A function that takes a ``Job`` has input and returns the maximized scalar value monitored by this callback. Defaults to ``None`` to monitor ``job.result`` directly.
     """
 
-    def __init__(self, patience: int = 10, objective_func=lambda j: j.result):
-        self._best_objective = None
+    def __init__(self, patience: int = 10, objective_func=None):
+        self._best_objective = -math.inf
         self._n_lower = 0
         self._patience = patience
         self._objective_func = objective_func
@@ -193,21 +296,23 @@ class SearchEarlyStopping(Callback):
         self.on_done(job)
 
     def on_done(self, job):
-        job_objective = self._objective_func(job)
+        if self._objective_func is None:
+            job_objective = job.result
+        else:
+            job_objective = self._objective_func(job)
         # if multi objectives are received
         if np.ndim(job_objective) > 0:
             job_objective = np.sum(job_objective)
-        if self._best_objective is None:
-            self._best_objective = job_objective
-        else:
-            if job_objective > self._best_objective:
+        if job_objective > self._best_objective:
+            # no message for the first received objective
+            if self._best_objective > -math.inf:
                 print(
                     f"Objective has improved from {self._best_objective:.5f} -> {job_objective:.5f}"
                 )
-                self._best_objective = job_objective
-                self._n_lower = 0
-            else:
-                self._n_lower += 1
+            self._best_objective = job_objective
+            self._n_lower = 0
+        else:
+            self._n_lower += 1
 
         if self._n_lower >= self._patience:
             print(
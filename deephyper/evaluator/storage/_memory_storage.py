@@ -1,4 +1,6 @@
-import copy
+import itertools
+import threading
+from copy import deepcopy as _deepcopy
 from typing import Any, Dict, Hashable, List, Tuple
 
 from deephyper.evaluator.storage._storage import Storage
@@ -8,6 +10,10 @@ class MemoryStorage(Storage):
     """Storage client for local in-memory storage.
 
     This backend does not allow to share the data between evaluators running in different processes.
+
+    The ``load_search`` and ``load_job`` methods return a copy of the stored data by default. When called with ``copy=False`` they return the stored dictionaries themselves: these are live views in which later stores (e.g., a new output or an overwritten metadata value) are visible, and callers must not mutate them.
+
+    The storage can be shared between threads. Only the creation of searches and jobs is serialized by a lock; the data of each job is created upfront so that writes to different jobs do not contend, and readers iterate over snapshots of the jobs of a search.
     """
 
     def __init__(self) -> None:
@@ -15,27 +21,72 @@ class MemoryStorage(Storage):
 
         self._search_id_counter = 0
         self._data = {}
+        self._lock = threading.Lock()
+
+        # (job_id, data) of the last accessed job, successive writes to the same job
+        # are common. A single tuple is swapped so that concurrent threads never
+        # observe the identifier of a job with the data of another.
+        self._cached_job = (None, None)
 
     def _connect(self):
         self.connected = True
 
     def __getstate__(self):
-        state = {"_search_id_counter": 0, "_data": {}, "connected": False}
+        state = {
+            "_search_id_counter": 0,
+            "_data": {},
+            "_cached_job": (None, None),
+            "connected": False,
+        }
         return state
 
     def __setstate__(self, newstate):
         self.__dict__.update(newstate)
+        self._lock = threading.Lock()
         self.connect()
 
+    @staticmethod
+    def _parse(job_id: Hashable) -> Tuple[Hashable, int]:
+        """Returns the ``(search_id, partial_id)`` pair of a job identifier. The job identifier can be given either as a ``"search_id.partial_id"`` string or directly as a ``(search_id, partial_id)`` tuple in which case no parsing is done.
+
+        Args:
+            job_id (Hashable): The identifier of the job.
+
+        Returns:
+            Tuple[Hashable, int]: The identifier of the search and the partial identifier of the job in this search.
+        """
+        if type(job_id) is tuple:
+            return job_id
+        search_id, _, partial_id = job_id.partition(".")
+        return search_id, int(partial_id)
+
+    def _job_data(self, job_id: Hashable) -> dict:
+        """Returns the stored data of a job, reusing the last resolved job when possible.
+
+        Args:
+            job_id (Hashable): The identifier of the job.
+
+        Returns:
+            dict: The stored data of the job.
+        """
+        cached_job_id, cached_data = self._cached_job
+        if job_id == cached_job_id:
+            return cached_data
+        search_id, partial_id = self._parse(job_id)
+        data = self._data[search_id]["data"][partial_id]
+        self._cached_job = (job_id, data)
+        return data
+
     def create_new_search(self) -> Hashable:
         """Create a new search in the store and returns its identifier.
 
         Returns:
             Hashable: The identifier of the search.
         """
-        search_id = f"{self._search_id_counter}"  # converting to str
-        self._search_id_counter += 1
-        self._data[search_id] = {"job_id_counter": 0, "data": {}}
+        with self._lock:
+            search_id = f"{self._search_id_counter}"  # converting to str
+            self._search_id_counter += 1
+            self._data[search_id] = {"job_id_counter": itertools.count(), "data": {}}
         return search_id
 
     def create_new_job(self, search_id: Hashable) -> Hashable:
@@ -48,16 +99,18 @@ class MemoryStorage(Storage):
         Returns:
             Hashable: The created identifier of the job.
         """
-        partial_id = self._data[search_id]["job_id_counter"]
-        partial_id = f"{partial_id}"  # converting to str
-        job_id = f"{search_id}.{partial_id}"
-        self._data[search_id]["job_id_counter"] += 1
-        self._data[search_id]["data"][partial_id] = {
+        search = self._data[search_id]
+        data = {
             "in": None,
             "out": None,
             "metadata": {},
             "intermediate": {"budget": [], "objective": []},
         }
+        with self._lock:
+            partial_id = next(search["job_id_counter"])
+            search["data"][partial_id] = data
+        job_id = f"{search_id}.{partial_id}"
+        self._cached_job = (job_id, data)
         return job_id
 
     def store_job(self, job_id: Hashable, key: Hashable, value: Any) -> None:
@@ -68,9 +121,7 @@ class MemoryStorage(Storage):
             key (Hashable): A key to use to store the value.
             value (Any): The value to store.
         """
-        search_id, partial_id = job_id.split(".")
-
-        self._data[search_id]["data"][partial_id][key] = value
+        self._job_data(job_id)[key] = value
 
     def store_job_in(
         self, job_id: Hashable, args: Tuple = None, kwargs: Dict = None
@@ -82,7 +133,7 @@ class MemoryStorage(Storage):
             args (Optional[Tuple], optional): The positional arguments. Defaults to None.
             kwargs (Optional[Dict], optional): The keyword arguments. Defaults to None.
         """
-        self.store_job(job_id, key="in", value={"args": args, "kwargs": kwargs})
+        self._job_data(job_id)["in"] = {"args": args, "kwargs": kwargs}
 
     def store_job_out(self, job_id: Hashable, value: Any) -> None:
         """Stores the output value of the executed job.
@@ -91,7 +142,7 @@ class MemoryStorage(Storage):
             job_id (Hashable): The identifier of the job.
             value (Any): The value to store.
         """
-        self.store_job(job_id, key="out", value=value)
+        self._job_data(job_id)["out"] = value
 
     def store_job_metadata(self, job_id: Hashable, key: Hashable, value: Any) -> None:
         """Stores other metadata related to the execution of the job.
@@ -101,8 +152,7 @@ class MemoryStorage(Storage):
             key (Hashable): A key to use to store the metadata of the given job.
             value (Any): The value to store.
         """
-        search_id, partial_id = job_id.split(".")
-        self._data[search_id]["data"][partial_id]["metadata"][key] = value
+        self._job_data(job_id)["metadata"][key] = value
 
     def load_all_search_ids(self) -> List[Hashable]:
         """Loads the identifiers of all recorded searches.
@@ -121,34 +171,40 @@ class MemoryStorage(Storage):
         Returns:
             List[Hashable]: A list of identifiers of all the jobs.
         """
-        partial_ids = self._data[search_id]["data"].keys()
+        partial_ids = list(self._data[search_id]["data"])
         job_ids = [f"{search_id}.{p_id}" for p_id in partial_ids]
         return job_ids
 
-    def load_search(self, search_id: Hashable) -> dict:
+    def load_search(self, search_id: Hashable, copy: bool = True) -> dict:
         """Loads the data of a search.
 
         Args:
             search_id (Hashable): The identifier of the search.
+            copy (bool, optional): If ``False`` the data of jobs is returned as live views reflecting later stores, which must not be modified. Defaults to ``True``.
 
         Returns:
             dict: The corresponding data of the search.
         """
-        data = self._data[search_id]["data"]
-        return copy.deepcopy(data)
+        data = list(self._data[search_id]["data"].items())
+        if copy:
+            return {f"{p_id}": _deepcopy(v) for p_id, v in data}
+        return {f"{p_id}": v for p_id, v in data}
 
-    def load_job(self, job_id: Hashable) -> dict:
+    def load_job(self, job_id: Hashable, copy: bool = True) -> dict:
         """Loads the data of a job.
 
         Args:
             job_id (Hashable): The identifier of the job.
+            copy (bool, optional): If ``False`` the data of the job is returned as a live view reflecting later stores, which must not be modified. Defaults to ``True``.
 
         Returns:
             dict: The corresponding data of the job.
         """
-        search_id, partial_id = job_id.split(".")
+        search_id, partial_id = self._parse(job_id)
         data = self._data[search_id]["data"][partial_id]
-        return copy.deepcopy(data)
+        if copy:
+            return _deepcopy(data)
+        return data
 
     def store_search_value(
         self, search_id: Hashable, key: Hashable, value: Any
@@ -185,7 +241,7 @@ class MemoryStorage(Storage):
         """
         search_id
         values = []
-        for job_data_i in self._data[search_id]["data"].values():
+        for job_data_i in list(self._data[search_id]["data"].values()):
             value_i = job_data_i["metadata"].get(key, None)
             if value_i is not None:
                 values.append(value_i)
@@ -201,7 +257,7 @@ class MemoryStorage(Storage):
             List[Any]: A list of all the retrieved output values.
         """
         values = []
-        for job_data_i in self._data[search_id]["data"].values():
+        for job_data_i in list(self._data[search_id]["data"].values()):
             value_i = job_data_i["out"]
             if value_i is not None:
                 values.append(value_i)
@@ -217,8 +273,11 @@ class MemoryStorage(Storage):
             dict: A dictionnary of the retrieved values where the keys are the identifier of jobs.
         """
         data = {}
+        # jobs usually belong to the same search which is only resolved once
+        last_search_id, search_data = None, None
         for job_id in job_ids:
-            search_id, partial_id = job_id.split(".")
-            job_data = self._data[search_id]["data"][partial_id]
-            data[job_id] = job_data
+            search_id, partial_id = self._parse(job_id)
+            if search_id != last_search_id:
+                last_search_id, search_data = search_id, self._data[search_id]["data"]
+            data[job_id] = search_data[partial_id]
         return data
@@ -1,3 +1,4 @@
+import concurrent.futures
 import unittest
 import pytest
 
@@ -69,6 +70,41 @@ class TestMemoryStorage(unittest.TestCase):
         job_id0_data = storage.load_job(job_id0)
         self.assertEqual(job_id0_data["metadata"], {"timestamp": 10})
 
+        # Job identifiers can also be given as (search_id, partial_id) tuples
+        storage.store_job_metadata((search_id1, 0), "timestamp", 20)
+        job_id0_data = storage.load_job(job_id0)
+        self.assertEqual(job_id0_data["metadata"], {"timestamp": 20})
+
+        search_data = storage.load_search(search_id1)
+        self.assertEqual(list(search_data.keys()), ["0", "1"])
+
+        # Loading without copy returns the stored data
+        job_id0_data = storage.load_job(job_id0, copy=False)
+        self.assertIs(job_id0_data, storage.load_job(job_id0, copy=False))
+        search_data = storage.load_search(search_id1, copy=False)
+        self.assertIs(search_data["0"], job_id0_data)
+
+    def test_threads(self):
+        storage = MemoryStorage()
+        search_id = storage.create_new_search()
+
+        def create_and_store(i):
+            job_id = storage.create_new_job(search_id)
+            storage.store_job_in(job_id, args=(i,))
+            storage.store_job_out(job_id, i)
+            storage.store_job_metadata(job_id, "i", i)
+            return job_id
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            job_ids = list(executor.map(create_and_store, range(1000)))
+
+        self.assertEqual(len(set(job_ids)), 1000)
+        self.assertEqual(len(storage.load_all_job_ids(search_id)), 1000)
+        for job_id, job_data in storage.load_jobs(job_ids).items():
+            i = job_data["in"]["args"][0]
+            self.assertEqual(job_data["out"], i)
+            self.assertEqual(job_data["metadata"], {"i": i})
+
     def test_with_evaluator(self):
         storage = MemoryStorage()
 
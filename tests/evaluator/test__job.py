@@ -0,0 +1,56 @@
+import unittest
+import pytest
+
+from deephyper.evaluator import Job, RunningJob
+
+
+@pytest.mark.fast
+@pytest.mark.hps
+class TestJob(unittest.TestCase):
+    def test_config_is_copied(self):
+        config = {"x": 0, "y": "a"}
+        job = Job("0.0", config, run_function=None)
+        config["x"] = 1
+        assert job.config == {"x": 0, "y": "a"}
+
+        nested_config = {"x": [0, 1]}
+        job = Job("0.1", nested_config, run_function=None)
+        nested_config["x"].append(2)
+        assert job.config == {"x": [0, 1]}
+
+        nested_config = {"x": {"y": [0]}, "z": (0, 1)}
+        job = Job("0.2", nested_config, run_function=None)
+        nested_config["x"]["y"].append(1)
+        assert job.config == {"x": {"y": [0]}, "z": (0, 1)}
+
+    def test_getitem(self):
+        job = Job("0.0", {"x": 0}, run_function=None)
+        job.output["objective"] = 1.0
+        config, objective = job
+        assert config is job.config
+        assert objective == 1.0
+
+        config = job.config_copy()
+        config["x"] = 1
+        assert job.config == {"x": 0}
+
+    def test_running_job_getitem(self):
+        job = RunningJob(parameters={"x": 0})
+        assert job["x"] == 0
+        assert job["job_id"] == 0
+        assert "x" in job and "job_id" in job
+        with pytest.raises(KeyError):
+            job["y"]
+
+        # "job_id" is reserved even if present in the configuration
+        job = RunningJob(parameters={"x": 0, "job_id": 42})
+        assert job["job_id"] == 0
+        with pytest.raises(KeyError):
+            job["job_id"] = 1
+
+
+if __name__ == "__main__":
+    test = TestJob()
+    test.test_config_is_copied()
+    test.test_getitem()
+    test.test_running_job_getitem()
@@ -0,0 +1,131 @@
+import contextlib
+import io
+import unittest
+import numpy as np
+import pytest
+
+from deephyper.core.exceptions import SearchTerminationError
+from deephyper.evaluator import Evaluator, Job
+from deephyper.evaluator.callback import (
+    LoggerCallback,
+    ProfilingCallback,
+    SearchEarlyStopping,
+    TqdmCallback,
+)
+
+
+def run(job):
+    return job["x"]
+
+
+def make_job(objective):
+    job = Job("0.0", {}, run_function=None)
+    job.output["objective"] = objective
+    return job
+
+
+@pytest.mark.fast
+@pytest.mark.hps
+class TestCallback(unittest.TestCase):
+    def test_profiling_callback(self):
+        profiler = ProfilingCallback()
+        evaluator = Evaluator.create(
+            run, method="serial", method_kwargs={"callbacks": [profiler]}
+        )
+        evaluator.submit([{"x": i} for i in range(5)])
+        evaluator.gather("ALL")
+
+        df = profiler.profile
+        assert list(df.columns) == ["timestamp", "n_jobs_running"]
+        assert len(df) == 10
+        assert df["timestamp"].is_monotonic_increasing
+        assert df["n_jobs_running"].min() >= 0
+        assert df["n_jobs_running"].iloc[-1] == 0
+        # the returned profile is a copy of the cached one
+        df["timestamp"] -= 5
+        assert profiler.profile is not df
+        assert (profiler.profile["timestamp"] == df["timestamp"] + 5).all()
+
+        evaluator.submit([{"x": 0}])
+        evaluator.gather("ALL")
+        assert len(profiler.profile) == 12
+
+    def test_logger_and_tqdm_callbacks(self):
+        def run_with_failures(job):
+            return "F_failed" if job["x"] % 2 else job["x"]
+
+        logger = LoggerCallback()
+        progress = TqdmCallback()
+        evaluator = Evaluator.create(
+            run_with_failures,
+            method="serial",
+            method_kwargs={"callbacks": [logger, progress]},
+        )
+        evaluator.submit([{"x": i} for i in range(5)])
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            evaluator.gather("ALL")
+
+        lines = stdout.getvalue().splitlines()
+        assert len(lines) == 5
+        assert sum("received failure" in line for line in lines) == 2
+        assert logger._best_objective == 4
+        assert progress._best_objective == 4
+        assert progress._n_failures == 2
+        assert progress._n_done == 5
+        assert progress._tqdm.n == 5
+
+    def test_search_early_stopping(self):
+        callback = SearchEarlyStopping(patience=2)
+        callback.on_done(make_job(1.0))
+        callback.on_done(make_job(2.0))
+        callback.on_done(make_job(0.0))
+        assert callback._best_objective == 2.0
+        with pytest.raises(SearchTerminationError):
+            callback.on_done(make_job(1.0))
+
+        callback = SearchEarlyStopping(patience=2, objective_func=lambda j: -j.result)
+        callback.on_done(make_job(1.0))
+        callback.on_done(make_job(0.0))
+        assert callback._best_objective == 0.0
+
+    def test_logger_callback_on_done(self):
+        logger = LoggerCallback()
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            logger.on_done(make_job(1.0))
+            logger.on_done_other(make_job("F_failed"))
+
+        lines = stdout.getvalue().splitlines()
+        assert lines == [
+            "[00001] -- best objective: 1.00000 -- received objective: 1.00000",
+            "[00002] -- received failure: F_failed",
+        ]
+
+    def test_float32_nan_objectives(self):
+        logger = LoggerCallback()
+        progress = TqdmCallback()
+        jobs = [
+            make_job((np.float32("nan"), np.float32(1))),
+            make_job((np.float32(2), np.float32(3))),
+            make_job(np.float32("nan")),
+        ]
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            for job in jobs:
+                logger.on_done(job)
+                progress.on_done(job)
+
+        assert "nan" not in stdout.getvalue()
+        assert logger._best_objective == 5
+        assert progress._best_objective == 5
+        assert progress._n_failures == 2
+
+
+if __name__ == "__main__":
+    test = TestCallback()
+    test.test_profiling_callback()
+    test.test_logger_and_tqdm_callbacks()
+    test.test_search_early_stopping()
+    test.test_logger_callback_on_done()
+    test.test_float32_nan_objectives()